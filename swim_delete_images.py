@@ -12,21 +12,45 @@ Features
 """
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
+import itertools
 import json
 import os
+import random
 import re
 import sys
 import time
-from typing import Any, Dict, List, Optional
+import urllib.parse
+from typing import Any, Callable, Dict, Iterator, Optional
 
-# --- lightweight dependency handling (requests) ---
+# --- required dependency (requests); fail fast instead of installing at runtime ---
 try:
     import requests  # type: ignore
-except Exception:
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "requests"])
-    import requests  # type: ignore
+except ImportError:
+    sys.exit("ERROR: the 'requests' package is required: pip install -r requirements.txt")
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# httpx + h2 are optional (used with --http2): HTTP/2 lets concurrent deletes/task polls share one connection
+try:
+    import h2  # type: ignore  # noqa: F401  (httpx needs it for http2=True)
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None
+
+# google-re2 is optional: linear-time matching for user-supplied --*-regex patterns
+try:
+    import re2  # type: ignore
+except ImportError:
+    re2 = None
+
+# orjson is optional: faster decode of large image lists, stdlib json otherwise
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 # ---------- Helpers ----------
 
@@ -47,63 +71,205 @@ def parse_bool(s: Optional[str]) -> Optional[bool]:
         return False
     return None
 
+def progress_done(progress: Any) -> bool:
+    # Task "progress" strings vary by release; treat these keywords as completion
+    return bool(progress) and any(k in str(progress).lower() for k in ("completed", "success", "done", "deletion"))
+
+def _poll_delay(r: Any, backoff: float, remaining: float) -> float:
+    # Honor a numeric Retry-After when present, else backoff + jitter; never sleep past the deadline
+    delay = backoff + random.uniform(0, 0.1)
+    retry_after = r.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form; stick with our own backoff
+    return max(0.0, min(delay, remaining))
+
+def loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def emit_json(obj: Any):
+    # Serialize straight to stdout rather than building one big str first
+    sys.stdout.flush()  # keep ordering with earlier print()/log() output
+    if orjson:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+def unwrap_response(body: Any) -> Any:
+    # Intent API payloads usually wrap results in {"response": ...}
+    data = body.get("response") if isinstance(body, dict) else body
+    return body if data is None else data
+
 # ---------- API wrapper ----------
 
 class CatalystCenter:
+    POOL_SIZE = 32  # keep-alive connections; also caps --concurrency
+
     def __init__(self, base_url: str, username: Optional[str], password: Optional[str],
-                 token: Optional[str], verify: bool):
+                 token: Optional[str], verify: bool, token_cache: bool = True, http2: bool = False):
         self.base = base_url.rstrip("/")
         self.verify = verify
-        self.session = requests.Session()
-        self.session.verify = verify
+        self._delete_path_template: Optional[str] = None
+        self.session = self._build_session(verify, http2)
         self.session.headers.update({"Content-Type": "application/json"})
         if token:
             self.session.headers["X-Auth-Token"] = token
         elif username and password:
-            self._login(username, password)
+            cache_path = self._token_cache_path(username) if token_cache else None
+            cached = self._load_cached_token(cache_path) if cache_path else None
+            if cached and self._token_valid(cached):
+                self.session.headers["X-Auth-Token"] = cached
+            else:
+                self._login(username, password)
+                if cache_path:
+                    self._save_cached_token(cache_path, self.session.headers["X-Auth-Token"])
         else:
             die("Provide either --token OR --username/--password")
 
+    def _build_session(self, verify: bool, http2: bool):
+        # HTTP/2 is opt-in (--http2) so installing httpx never silently changes the transport
+        if http2:
+            if not httpx:
+                die("--http2 needs httpx and h2: pip install 'httpx[http2]'")
+            limits = httpx.Limits(max_connections=self.POOL_SIZE, max_keepalive_connections=self.POOL_SIZE)
+            # httpx only retries failed connects (no 5xx retry like the requests path below).
+            transport = httpx.HTTPTransport(http2=True, limits=limits, verify=verify, retries=3)
+            # timeout=None matches requests' default of waiting on slow SWIM calls
+            return httpx.Client(transport=transport, timeout=None)
+        session = requests.Session()
+        session.verify = verify
+        # One keep-alive pool shared by every call; retry transient gateway errors.
+        # raise_on_status=False so exhausted retries still hand back the response for our status checks.
+        # Retry-After is left to get_task, which caps it at the task timeout.
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=["GET", "DELETE", "POST"], raise_on_status=False,
+                      respect_retry_after_header=False)
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    # Token cache: ~/.cache/cc_swim/token-<host>-<user>.json (0600) so repeated runs skip the
+    # auth round-trip. Tokens usually live 1h and nothing re-authenticates mid-run, so a cached
+    # token is only reused while at least 20 minutes of that lifetime remain.
+    TOKEN_TTL = 2400
+
+    def _token_cache_path(self, username: str) -> str:
+        host = urllib.parse.urlparse(self.base).netloc or self.base
+        key = re.sub(r"[^A-Za-z0-9._-]", "_", f"{host}-{username}")
+        return os.path.join(os.path.expanduser("~"), ".cache", "cc_swim", f"token-{key}.json")
+
+    def _load_cached_token(self, path: str) -> Optional[str]:
+        try:
+            with open(path, "rb") as f:
+                entry = loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        token, exp = entry.get("token"), entry.get("exp")
+        # Anything malformed is just a cache miss
+        if not isinstance(token, str) or not token:
+            return None
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool) or exp <= time.time():
+            return None
+        return token
+
+    def _save_cached_token(self, path: str, token: str):
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # The mode above only applies on create; tighten a pre-existing file too
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "exp": time.time() + self.TOKEN_TTL}, f)
+        except OSError as e:
+            # Not fatal—we just log in again next run
+            log(f"Warning: could not write token cache {path}: {e}")
+
+    def _token_valid(self, token: str) -> bool:
+        # Cheap authenticated GET; anything but 200 means fall back to a fresh login
+        url = f"{self.base}/dna/intent/api/v1/network-device/count"
+        r = self.session.get(url, headers={"X-Auth-Token": token})
+        return r.status_code == 200
+
     def _login(self, username: str, password: str):
         # POST /dna/system/api/v1/auth/token
         url = f"{self.base}/dna/system/api/v1/auth/token"
         r = self.session.post(url, auth=(username, password))
         if r.status_code not in (200, 201):
             die(f"Auth failed ({r.status_code}): {r.text}")
-        token = r.json().get("Token") or r.json().get("token")
+        body = loads(r.content)
+        token = body.get("Token") or body.get("token")
         if not token:
             die("Auth succeeded but no token in response")
         self.session.headers["X-Auth-Token"] = token
 
     # Task poller: GET /dna/intent/api/v1/task/{taskId}
-    def get_task(self, task_id: str, timeout: int = 300, poll_interval: float = 2.5) -> Dict[str, Any]:
+    # Polls with 1.25x exponential backoff (poll_interval -> max_interval) plus jitter so
+    # fast tasks are noticed quickly and concurrent pollers don't fire in lockstep.
+    # 429/503 (throttled) responses are waited out rather than treated as task failures.
+    def get_task(self, task_id: str, timeout: int = 300, poll_interval: float = 0.2,
+                 max_interval: float = 3.0) -> Dict[str, Any]:
         url = f"{self.base}/dna/intent/api/v1/task/{task_id}"
         start = time.time()
+        cur = poll_interval
         while True:
             r = self.session.get(url)
+            remaining = timeout - (time.time() - start)
+            if r.status_code in (429, 503):
+                if remaining <= 0:
+                    return {"error": f"task query throttled ({r.status_code}) until timeout", "raw": r.text}
+                time.sleep(_poll_delay(r, cur, remaining))
+                cur = min(cur * 1.25, max_interval)
+                continue
             if r.status_code != 200:
                 return {"error": f"task query failed {r.status_code}", "raw": r.text}
-            data = r.json().get("response") or r.json()
+            data = unwrap_response(loads(r.content))
             progress = (data or {}).get("progress")
             is_error = (data or {}).get("isError")
             failure = (data or {}).get("failureReason")
             if is_error or failure:
                 return {"error": failure or "task reported error", "raw": data}
-            if progress and any(k in str(progress).lower() for k in ("completed", "success", "done", "deletion")):
+            if progress_done(progress):
                 return {"ok": True, "data": data}
-            if time.time() - start > timeout:
+            if remaining <= 0:
                 return {"error": "task timeout", "raw": data}
-            time.sleep(poll_interval)
+            time.sleep(_poll_delay(r, cur, remaining))
+            cur = min(cur * 1.25, max_interval)
 
-    # List images (SWIM “image importation” inventory)
+    # List images (SWIM “image importation” inventory), paged with limit/offset
     # GET /dna/intent/api/v1/image/importation?family=...&name=...&version=...
-    def list_images(self, **params) -> List[Dict[str, Any]]:
+    # Catalyst Center intent APIs count offset from 1. Images are de-duplicated by id and paging
+    # stops once a page adds nothing new, so a server that ignores limit/offset can't loop us.
+    def iter_images(self, page_size: int = 500, max_pages: int = 200, **params) -> Iterator[Dict[str, Any]]:
         url = f"{self.base}/dna/intent/api/v1/image/importation"
         # Cisco’s SWIM guide uses this endpoint for query by family/name/version. (Ref) developer.cisco.com SWIM guide.
-        r = self.session.get(url, params=params)
-        if r.status_code != 200:
-            die(f"List images failed ({r.status_code}): {r.text}")
-        return r.json().get("response") or r.json()
+        seen = set()
+        offset = 1
+        for _ in range(max_pages):
+            r = self.session.get(url, params={"limit": page_size, "offset": offset, **params})
+            if r.status_code != 200:
+                die(f"List images failed ({r.status_code}): {r.text}")
+            page = unwrap_response(loads(r.content))
+            new = 0
+            for img in page:
+                img_id = _image_id(img)
+                if img_id is not None:
+                    if img_id in seen:
+                        continue
+                    seen.add(img_id)
+                new += 1
+                yield img
+            if len(page) < page_size or not new:
+                return
+            offset += page_size
+        log(f"Warning: stopped listing images after {max_pages} pages; results may be incomplete")
 
     # Remove Golden tag (optional pre-step)
     # DELETE /dna/intent/api/v1/image/importation/golden/site/{siteId}/family/{deviceFamilyIdentifier}/role/{deviceRole}/image/{imageId}
@@ -111,7 +277,7 @@ class CatalystCenter:
         url = f"{self.base}/dna/intent/api/v1/image/importation/golden/site/{site_id}/family/{family_id}/role/{role}/image/{image_id}"
         r = self.session.delete(url)
         if r.status_code in (200, 202):
-            body = r.json()
+            body = loads(r.content)
             task_id = (body.get("response") or {}).get("taskId")
             return task_id
         if r.status_code == 204:
@@ -122,79 +288,139 @@ class CatalystCenter:
 
     # Delete image: API pathname changed over time and isn’t prominently documented;
     # we try the most likely DELETE endpoints with fallbacks and surface errors clearly.
+    # The first path that works is remembered so bulk runs don't re-probe per image.
+    DELETE_PATH_TEMPLATES = [
+        "/dna/intent/api/v1/image/importation/{image_id}",  # likely path (newer)
+        "/dna/intent/api/v1/image/{image_id}",  # fallback seen in some older builds
+    ]
+
     def delete_image(self, image_id: str) -> Dict[str, Any]:
         tried = []
+        templates = [self._delete_path_template] if self._delete_path_template else self.DELETE_PATH_TEMPLATES
 
-        # 1) Likely path (newer): /dna/intent/api/v1/image/importation/{imageId}
-        for path in [
-            f"/dna/intent/api/v1/image/importation/{image_id}",
-            f"/dna/intent/api/v1/image/{image_id}",  # fallback seen in some older builds
-        ]:
+        for template in templates:
+            path = template.format(image_id=image_id)
             url = f"{self.base}{path}"
             r = self.session.delete(url)
             tried.append((path, r.status_code))
             if r.status_code in (200, 202):
-                body = r.json()
-                task_id = (body.get("response") or {}).get("taskId")
-                return {"ok": True, "taskId": task_id, "path": path}
+                self._delete_path_template = template
+                body = loads(r.content)
+                resp = body.get("response") or {}
+                # Some builds report an already-finished task inline; no need to poll it.
+                immediate = not resp.get("isError") and progress_done(resp.get("progress"))
+                return {"ok": True, "taskId": resp.get("taskId"), "path": path, "immediate": immediate}
             if r.status_code == 204:
-                return {"ok": True, "taskId": None, "path": path}
+                self._delete_path_template = template
+                return {"ok": True, "taskId": None, "path": path, "immediate": True}
             # 409 could be “is golden” or “in use”; bubble up after trying both paths
         return {"ok": False, "tried": tried, "last_text": r.text}
 
 # ---------- Filtering ----------
 
-def compile_filters(args):
-    v_regex = re.compile(args.version_regex) if args.version_regex else None
-    name_regex = re.compile(args.name_regex) if args.name_regex else None
-    older_than = dt.timedelta(days=args.older_than_days) if args.older_than_days else None
-    now = dt.datetime.utcnow()
-
-    def _match(img: Dict[str, Any]) -> bool:
-        # Common fields found in /image/importation results (names vary slightly across versions)
-        family = (img.get("family") or img.get("familyName") or "").lower()
-        name = (img.get("name") or img.get("imageName") or "").lower()
-        version = (img.get("version") or img.get("softwareVersion") or "").lower()
-        image_type = (img.get("imageType") or img.get("type") or "").lower()
-        is_golden = bool(img.get("isTaggedGolden") or img.get("isGolden") or img.get("golden"))
+@functools.lru_cache(maxsize=None)
+def _compile(pattern: str):
+    if re2:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass  # PCRE-only feature (backrefs, lookaround); fall back to re
+    return re.compile(pattern)
+
+def _image_id(img: Dict[str, Any]) -> Optional[str]:
+    return img.get("imageUuid") or img.get("id") or img.get("imageId")
+
+def _normalize(img: Dict[str, Any]) -> Dict[str, Any]:
+    # Common fields found in /image/importation results (names vary slightly across versions)
+    name = img.get("name") or img.get("imageName")
+    version = img.get("version") or img.get("softwareVersion")
+    family = img.get("family") or img.get("familyName")
+    image_type = img.get("imageType") or img.get("type")
+    return {
+        "id": _image_id(img),
+        "name": name,
+        "version": version,
+        "family": family,
+        "type": image_type,
+        # Lower-cased once here so the filter predicates don't allocate per check
+        "name_lc": (name or "").lower(),
+        "version_lc": (version or "").lower(),
+        "family_lc": (family or "").lower(),
+        "type_lc": (image_type or "").lower(),
+        "golden": bool(img.get("isTaggedGolden") or img.get("isGolden") or img.get("golden")),
+        # Some payloads expose "usedDevicesCount" or "applicableDevicesCount".
+        "used": img.get("usedDevicesCount") or img.get("usingDeviceCount") or img.get("deviceCount") or 0,
         # When imported?
-        created = img.get("createdTime") or img.get("importedDate") or img.get("lastUpdateTime")
-        created_dt = None
-        if created:
-            try:
-                # Try ISO first, fallback epoch ms
-                if isinstance(created, (int, float)):
-                    created_dt = dt.datetime.utcfromtimestamp(int(created) / 1000 if int(created) > 10**10 else int(created))
-                else:
-                    created_dt = dt.datetime.fromisoformat(str(created).replace("Z", "+00:00")).replace(tzinfo=None)
-            except Exception:
-                created_dt = None
+        "created": img.get("createdTime") or img.get("importedDate") or img.get("lastUpdateTime"),
+    }
+
+# `golden` is the parsed --golden value (True/False/None); args.golden holds the raw CLI string.
+def compile_filters(args, golden: Optional[bool] = None) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    v_regex = _compile(args.version_regex) if args.version_regex else None
+    name_regex = _compile(args.name_regex) if args.name_regex else None
+    # Bind filter values to locals once; _match runs per image.
+    fam_f = args.family.lower() if args.family else None
+    name_sub = args.name_contains.lower() if args.name_contains else None
+    name_exact = args.image_name.lower() if args.image_name else None
+    uuid_f = args.image_uuid
+    version_f = args.version.lower() if args.version else None
+    type_f = args.type.lower() if args.type else None
+    golden_f = golden
+    unused_only = args.unused_only
+    older_than = dt.timedelta(days=args.older_than_days) if args.older_than_days else None
+    # Only the age filter needs a clock; timestamps are compared as aware UTC datetimes.
+    now = dt.datetime.now(dt.timezone.utc) if older_than else None
 
-        if args.family and args.family.lower() not in family:
-            return False
-        if args.name_contains and args.name_contains.lower() not in name:
+    def _created_dt(created: Any) -> Optional[dt.datetime]:
+        if not created:
+            return None
+        try:
+            # Try ISO first, fallback epoch ms
+            if isinstance(created, (int, float)):
+                ts = int(created) / 1000 if int(created) > 10**10 else int(created)
+                return dt.datetime.fromtimestamp(ts, tz=dt.timezone.utc)
+            parsed = dt.datetime.fromisoformat(str(created).replace("Z", "+00:00"))
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+        except Exception:
+            return None
+
+    # Nothing to check: let the caller skip the per-image predicate entirely
+    if not (fam_f or name_sub or name_exact or uuid_f or version_f or type_f or v_regex or name_regex
+            or golden_f is not None or unused_only or older_than):
+        return None
+
+    # Takes a _normalize()d image
+    def _match(d: Dict[str, Any]) -> bool:
+        # Cheap string/flag rejectors first; regexes and timestamp parsing last.
+        if fam_f and fam_f not in d["family_lc"]:
             return False
-        if name_regex and not name_regex.search(name):
+        if name_sub and name_sub not in d["name_lc"]:
             return False
-        if args.version and args.version.lower() != version:
+        if name_exact and name_exact != d["name_lc"]:
             return False
-        if v_regex and not v_regex.search(version):
+        if uuid_f and uuid_f != d["id"]:
             return False
-        if args.type and args.type.lower() not in image_type:
+        if version_f and version_f != d["version_lc"]:
             return False
-        if args.golden is not None and is_golden != args.golden:
+        if type_f and type_f not in d["type_lc"]:
             return False
-        if older_than and created_dt and (now - created_dt) < older_than:
+        if golden_f is not None and d["golden"] != golden_f:
             return False
-        if args.unused_only:
-            # Some payloads expose "usedDevicesCount" or "applicableDevicesCount".
+        if unused_only:
             # We try to infer “unused” conservatively.
-            used = img.get("usedDevicesCount") or img.get("usingDeviceCount") or img.get("deviceCount") or 0
             try:
-                if int(used) > 0:
+                if int(d["used"]) > 0:
                     return False
             except Exception:
                 pass
+        if name_regex and name_regex.search(d["name_lc"]) is None:
+            return False
+        if v_regex and v_regex.search(d["version_lc"]) is None:
+            return False
+        if older_than:
+            created_dt = _created_dt(d["created"])
+            if created_dt and (now - created_dt) < older_than:
+                return False
         return True
 
     return _match
@@ -208,12 +434,18 @@ def build_arg_parser():
     auth.add_argument("--username", help="GUI/API username")
     auth.add_argument("--password", help="GUI/API password")
     auth.add_argument("--token", help="Use existing X-Auth-Token instead of username/password")
+    auth.add_argument("--no-token-cache", action="store_true",
+                      help="Don't reuse or store the auth token under ~/.cache/cc_swim")
+    auth.add_argument("--http2", action="store_true",
+                      help="Use an HTTP/2 httpx client (needs httpx[http2]; no 502/503/504 retries)")
     auth.add_argument("--insecure", action="store_true", help="Skip TLS verification")
 
     flt = p.add_argument_group("filters")
     flt.add_argument("--family", help="Device family filter (e.g., cat9k)")
     flt.add_argument("--type", help="Image type filter (e.g., bin, smu, rommon)")
     flt.add_argument("--name-contains", help="Substring match on image name")
+    flt.add_argument("--image-name", help="Exact image name match")
+    flt.add_argument("--image-uuid", help="Exact image UUID match")
     flt.add_argument("--name-regex", help="Regex on image name")
     flt.add_argument("--version", help="Exact version match (e.g., 17.9.4a)")
     flt.add_argument("--version-regex", help="Regex for version (e.g., '^17\\.9\\.')")
@@ -221,7 +453,7 @@ def build_arg_parser():
                      help="Filter by golden status")
     flt.add_argument("--older-than-days", type=int, help="Only images older than N days")
     flt.add_argument("--unused-only", action="store_true", help="Delete only images not used by any device")
-    flt.add_argument("--limit", type=int, default=0, help="Stop after deleting N images (0 = no limit)")
+    flt.add_argument("--limit", type=int, default=0, help="Select and delete at most N images (0 = no limit)")
 
     gold = p.add_argument_group("golden-tag (optional pre-step)")
     gold.add_argument("--site-id", help="Site UUID; use -1 for Global")
@@ -231,6 +463,8 @@ def build_arg_parser():
     safety = p.add_argument_group("safety & UX")
     safety.add_argument("--dry-run", action="store_true", help="Show what would be deleted; do nothing")
     safety.add_argument("--yes", action="store_true", help="Do not prompt; proceed (dangerous)")
+    safety.add_argument("--concurrency", type=int, default=8,
+                        help="Images to delete in parallel (default 8)")
     safety.add_argument("--json", action="store_true", help="Print result JSON for automation")
 
     return p
@@ -254,54 +488,57 @@ def main():
         username=args.username,
         password=args.password,
         token=args.token,
-        verify=verify
+        verify=verify,
+        token_cache=not args.no_token_cache,
+        http2=args.http2
     )
 
     # 1) Fetch candidate images (we’ll do fine-grained filtering client-side too)
     query = {}
     if args.family: query["family"] = args.family
     if args.version: query["version"] = args.version
-    if args.name_contains and not args.name_regex:
-        # Some deployments support ?name=exact; substring is handled client-side
-        pass
-
-    images = cc.list_images(**query)
-    match_fn = compile_filters(argparse.Namespace(
-        family=args.family,
-        name_contains=args.name_contains,
-        name_regex=args.name_regex,
-        version=args.version,
-        version_regex=args.version_regex,
-        type=args.type,
-        golden=golden_filter,
-        older_than_days=args.older_than_days,
-        unused_only=args.unused_only
-    ))
-
-    selected = [img for img in images if match_fn(img)]
+    if args.image_name: query["imageName"] = args.image_name
+    if args.image_uuid: query["imageUuid"] = args.image_uuid
+    if golden_filter is not None: query["isTaggedGolden"] = str(golden_filter).lower()
+    # ?name= is an exact match on the server, so --name-contains stays client-side only.
+
+    match_fn = compile_filters(args, golden=golden_filter)
 
     # Present selection
-    def img_row(img):
+    def img_row(d):
         return {
-            "imageUuid": img.get("imageUuid") or img.get("id") or img.get("imageId"),
-            "name": img.get("name") or img.get("imageName"),
-            "version": img.get("version") or img.get("softwareVersion"),
-            "family": img.get("family") or img.get("familyName"),
-            "type": img.get("imageType") or img.get("type"),
-            "golden": bool(img.get("isTaggedGolden") or img.get("isGolden") or img.get("golden")),
-            "usedCount": img.get("usedDevicesCount") or img.get("usingDeviceCount") or img.get("deviceCount") or 0
+            "imageUuid": d["id"],
+            "name": d["name"],
+            "version": d["version"],
+            "family": d["family"],
+            "type": d["type"],
+            "golden": d["golden"],
+            "usedCount": d["used"]
         }
 
-    table = [img_row(i) for i in selected]
+    # Stream pages through the filter; with --limit, stop fetching once enough matches are in.
+    cap = args.limit if args.limit and args.limit > 0 else None
+    normalized = map(_normalize, cc.iter_images(**query))
+    selected = filter(match_fn, normalized) if match_fn else normalized
+    rows = map(img_row, itertools.islice(selected, cap))
+
+    # Candidates are logged as they arrive; rows are only kept when something needs the full list.
+    keep = args.json or not args.dry_run
+    table, total = [], 0
     if not args.json:
         log("\nCandidates:")
-        for r in table:
+    for r in rows:
+        total += 1
+        if keep:
+            table.append(r)
+        if not args.json:
             log(f"- {r['imageUuid']}  {r['name']}  v{r['version']}  fam={r['family']}  type={r['type']}  golden={r['golden']}  used={r['usedCount']}")
-        log(f"\nTotal matches: {len(table)}")
+    if not args.json:
+        log(f"\nTotal matches: {total}")
 
     if args.dry_run:
         if args.json:
-            print(json.dumps({"dry_run": True, "matches": table}, indent=2))
+            emit_json({"dry_run": True, "matches": table})
         else:
             log("\nDRY RUN: no deletions performed.")
         return
@@ -314,14 +551,12 @@ def main():
         log("Aborted.")
         return
 
-    # Deletions
-    deleted, failures = [], []
-    limit = args.limit if args.limit and args.limit > 0 else len(table)
-    for r in table[:limit]:
+    # Deletions (each image is independent, so fan out across a thread pool)
+
+    def _delete_steps(r):
         img_id = r["imageUuid"]
         if not img_id:
-            failures.append({"row": r, "error": "missing imageUuid"})
-            continue
+            return False, r, "missing imageUuid"
 
         # Optional: remove golden tag first if parameters provided
         if r["golden"] and args.site_id and args.device_family_identifier and args.device_role:
@@ -330,30 +565,44 @@ def main():
             if task_id:
                 tr = cc.get_task(task_id)
                 if "error" in tr:
-                    failures.append({"row": r, "error": f"remove_golden failed: {tr['error']}"})
-                    continue
+                    return False, r, f"remove_golden failed: {tr['error']}"
 
         log(f"Deleting image {img_id} ({r['name']} v{r['version']}) ...")
         res = cc.delete_image(img_id)
-        if res.get("ok"):
-            task_id = res.get("taskId")
-            if task_id:
-                tr = cc.get_task(task_id)
-                if "error" in tr:
-                    failures.append({"row": r, "error": f"task failed: {tr['error']}"})
-                    continue
-            deleted.append(r)
-            log(f"Deleted {img_id}")
-        else:
-            failures.append({"row": r, "error": f"delete failed (paths tried {res.get('tried')}): {res.get('last_text')}"})
+        if not res.get("ok"):
+            return False, r, f"delete failed (paths tried {res.get('tried')}): {res.get('last_text')}"
+        task_id = res.get("taskId")
+        if task_id and not res.get("immediate"):
+            tr = cc.get_task(task_id)
+            if "error" in tr:
+                return False, r, f"task failed: {tr['error']}"
+        log(f"Deleted {img_id}")
+        return True, r, None
+
+    def _delete_one(r):
+        # Never let one image's exception abort the pool; every row must end up deleted or failed
+        try:
+            return _delete_steps(r)
+        except Exception as e:
+            return False, r, f"unexpected error: {type(e).__name__}: {e}"
+
+    deleted, failures = [], []
+    workers = max(1, min(args.concurrency, CatalystCenter.POOL_SIZE))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        # Results are collected here on the main thread, so the lists need no lock.
+        for ok, r, error in ex.map(_delete_one, table):
+            if ok:
+                deleted.append(r)
+            else:
+                failures.append({"row": r, "error": error})
 
     result = {"deleted": deleted, "failed": failures}
     if args.json:
-        print(json.dumps(result, indent=2))
+        emit_json(result)
     else:
         log(f"\nDone. Deleted: {len(deleted)}, Failed: {len(failures)}")
         if failures:
-            log(json.dumps(failures, indent=2))
+            emit_json(failures)
 
 
 if __name__ == "__main__":